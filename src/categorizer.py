@@ -1,8 +1,15 @@
 """Transaction categorization using Ollama LLM."""
 
-import json
+import asyncio
+import hashlib
+import os
+import re
+import threading
 import time
+from itertools import islice
+from pathlib import Path
 
+import orjson
 from loguru import logger
 
 from src.clients.ollama import OllamaClient, OllamaError
@@ -12,6 +19,9 @@ from src.prompts.categorize import CATEGORIZE_SYSTEM, CATEGORIZE_USER
 
 DEFAULT_BATCH_SIZE = 15
 
+# Max concurrent Ollama requests; matches the server's OLLAMA_NUM_PARALLEL
+DEFAULT_CONCURRENCY = int(os.getenv("OLLAMA_NUM_PARALLEL", "4"))
+
 
 class CategorizationError(Exception):
     """Error during transaction categorization."""
@@ -22,6 +32,33 @@ class CategorizationError(Exception):
         super().__init__(f"Failed to categorize '{transaction.description}': {reason}")
 
 
+def normalize_description(text: str) -> str:
+    """Normalize a description for matching (case/whitespace-insensitive).
+
+    Args:
+        text: Raw transaction description
+
+    Returns:
+        Lowercased description with collapsed whitespace
+    """
+    return " ".join(text.lower().split())
+
+
+def _category_enum_defs(category_names: list[str]) -> dict:
+    """Build the shared $defs block holding the category enum.
+
+    Both schemas reference this via $ref so the (potentially 50+ entry)
+    enum list appears once per serialized schema.
+    """
+    return {
+        "category": {
+            "type": "string",
+            "enum": category_names,
+            "description": "The assigned category",
+        },
+    }
+
+
 def build_categorization_schema(category_names: list[str]) -> dict:
     """Build a JSON schema for categorization with dynamic category enum.
 
@@ -33,6 +70,7 @@ def build_categorization_schema(category_names: list[str]) -> dict:
     """
     return {
         "type": "object",
+        "$defs": _category_enum_defs(category_names),
         "properties": {
             "assignments": {
                 "type": "array",
@@ -43,11 +81,7 @@ def build_categorization_schema(category_names: list[str]) -> dict:
                             "type": "string",
                             "description": "The transaction description",
                         },
-                        "category": {
-                            "type": "string",
-                            "enum": category_names,
-                            "description": "The assigned category",
-                        },
+                        "category": {"$ref": "#/$defs/category"},
                     },
                     "required": ["description", "category"],
                 },
@@ -68,12 +102,9 @@ def build_single_categorization_schema(category_names: list[str]) -> dict:
     """
     return {
         "type": "object",
+        "$defs": _category_enum_defs(category_names),
         "properties": {
-            "category": {
-                "type": "string",
-                "enum": category_names,
-                "description": "The assigned category",
-            },
+            "category": {"$ref": "#/$defs/category"},
         },
         "required": ["category"],
     }
@@ -87,22 +118,105 @@ class Categorizer:
         categories: CategoriesConfig,
         ollama_client: OllamaClient,
         batch_size: int = DEFAULT_BATCH_SIZE,
+        concurrency: int = DEFAULT_CONCURRENCY,
         debug_artifacts: DebugArtifacts | None = None,
+        cache_path: Path | None = None,
     ):
         self.categories = categories
         self.client = ollama_client
         self.batch_size = batch_size
+        self.concurrency = max(1, concurrency)
         self.debug_artifacts = debug_artifacts or DebugArtifacts()
         self._valid_categories = list(categories.get_category_names())
         self._batch_schema = build_categorization_schema(self._valid_categories)
         self._single_schema = build_single_categorization_schema(self._valid_categories)
 
+        # Compiled keyword alternations per category, used to resolve
+        # batch-fallback transactions without a second LLM round-trip.
+        self._keyword_patterns: list[tuple[str, re.Pattern[str]]] = [
+            (cat.name, re.compile("|".join(re.escape(kw) for kw in cat.keywords), re.IGNORECASE))
+            for cat in categories.categories
+            if cat.keywords
+        ]
+
+        # The system prompt is identical for every call — format it once.
+        prompt_text = categories.to_prompt_text()
+        self._system_prompt = CATEGORIZE_SYSTEM.format(categories=prompt_text)
+
+        # Cache of normalized description -> category; repeated merchants
+        # (subscriptions, groceries) skip the LLM entirely. Keyed to the
+        # category config so editing categories invalidates stale entries.
+        self._categories_hash = hashlib.sha256(prompt_text.encode()).hexdigest()[:16]
+        self._cache: dict[str, str] = {}
+        # Normalized descriptions whose "Other" came from the failure
+        # fallback (Ollama error / unparseable reply) rather than a real
+        # model answer; these must never be cached or a transient outage
+        # would permanently pin the merchant to "Other".
+        self._fallback_failures: set[str] = set()
+        self._cache_path = cache_path
+        if cache_path is not None:
+            self._load_cache()
+
+        # Pre-warm the model in the background so the first batch doesn't
+        # pay the cold model-load cost on the critical path.
+        self._warmup_thread = threading.Thread(target=self.client.warmup, daemon=True)
+        self._warmup_thread.start()
+
+    def _load_cache(self) -> None:
+        """Load the on-disk description cache, discarding stale entries."""
+        if self._cache_path is None or not self._cache_path.exists():
+            return
+        try:
+            data = orjson.loads(self._cache_path.read_bytes())
+        except (orjson.JSONDecodeError, OSError) as e:
+            logger.warning(f"Ignoring unreadable category cache: {e}")
+            return
+        if data.get("categories_hash") != self._categories_hash:
+            logger.info("Category config changed, discarding cached categorizations")
+            return
+        entries = data.get("entries", {})
+        self._cache.update(entries)
+        logger.info(f"Loaded {len(entries)} cached categorizations from {self._cache_path}")
+
+    def _save_cache(self) -> None:
+        """Persist the description cache to disk if a path was configured."""
+        if self._cache_path is None:
+            return
+        try:
+            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self._cache_path.write_bytes(
+                orjson.dumps(
+                    {"categories_hash": self._categories_hash, "entries": self._cache},
+                    option=orjson.OPT_INDENT_2,
+                )
+            )
+        except OSError as e:
+            logger.warning(f"Failed to write category cache: {e}")
+
     def categorize(
         self,
         transactions: list[RawTransaction],
     ) -> list[CategorizedTransaction]:
         """Categorize a list of transactions in batches.
 
+        Args:
+            transactions: List of raw transactions to categorize
+
+        Returns:
+            List of categorized transactions
+        """
+        return asyncio.run(self.categorize_async(transactions))
+
+    async def categorize_async(
+        self,
+        transactions: list[RawTransaction],
+    ) -> list[CategorizedTransaction]:
+        """Categorize transactions with batches running concurrently.
+
+        Batches are submitted in parallel (bounded by `concurrency`) so
+        wall-clock time approaches the slowest batch instead of the sum
+        when Ollama serves concurrent requests.
+
         Args:
             transactions: List of raw transactions to categorize
 
@@ -112,75 +226,169 @@ class Categorizer:
         if not transactions:
             return []
 
+        # Give the background warmup a chance to finish before the first
+        # batch; if the model is still loading the server queues us anyway.
+        if self._warmup_thread.is_alive():
+            await asyncio.to_thread(self._warmup_thread.join, 30.0)
+
         total_start = time.perf_counter()
-        results: list[CategorizedTransaction] = []
-        batches = list(self._batch(transactions, self.batch_size))
 
-        logger.info(f"Categorizing {len(transactions)} transactions in {len(batches)} batches")
+        # Split out descriptions we've already categorized (this run or a
+        # previous one via the on-disk cache) and keep one representative
+        # per remaining description; only those hit the LLM, and the
+        # cache fans the answers back out to every duplicate below.
+        seen: set[str] = set()
+        uncached: list[RawTransaction] = []
+        for tx in transactions:
+            norm = normalize_description(tx.description)
+            if norm not in self._cache and norm not in seen:
+                seen.add(norm)
+                uncached.append(tx)
+        if len(uncached) < len(transactions):
+            logger.info(
+                f"Category cache/dedup hit for {len(transactions) - len(uncached)}/"
+                f"{len(transactions)} transactions"
+            )
 
-        for i, batch in enumerate(batches):
-            batch_start = time.perf_counter()
-            batch_results = self._categorize_batch(batch, batch_num=i + 1)
-            batch_time = time.perf_counter() - batch_start
-            logger.info(f"[TIMING] Batch {i + 1}/{len(batches)}: {batch_time:.2f}s ({len(batch)} transactions)")
-            results.extend(batch_results)
+        # Keyword rules are authoritative per the prompt, so apply them
+        # before the LLM rather than only as a batch fallback — matched
+        # descriptions never cost a request.
+        llm_pending: list[RawTransaction] = []
+        keyword_hits = 0
+        for tx in uncached:
+            category = self._match_keywords(tx.description)
+            if category:
+                self._cache[normalize_description(tx.description)] = category
+                keyword_hits += 1
+            else:
+                llm_pending.append(tx)
+        if keyword_hits:
+            logger.info(f"Keyword match for {keyword_hits}/{len(uncached)} descriptions")
+        uncached = llm_pending
+
+        if uncached:
+            # Ceiling division; avoids materializing a list of batches
+            # just to count them.
+            n_batches = -(-len(uncached) // self.batch_size)
+            semaphore = asyncio.Semaphore(self.concurrency)
+
+            logger.info(
+                f"Categorizing {len(uncached)} transactions in {n_batches} batches "
+                f"(concurrency={self.concurrency})"
+            )
+
+            async def run_batch(batch: list[RawTransaction], batch_num: int) -> list[CategorizedTransaction]:
+                async with semaphore:
+                    batch_start = time.perf_counter()
+                    batch_results = await self._categorize_batch(batch, batch_num=batch_num)
+                    batch_time = time.perf_counter() - batch_start
+                    logger.info(
+                        f"[TIMING] Batch {batch_num}/{n_batches}: {batch_time:.2f}s ({len(batch)} transactions)"
+                    )
+                    return batch_results
+
+            batch_results = await asyncio.gather(
+                *(
+                    run_batch(batch, i + 1)
+                    for i, batch in enumerate(self._batch(uncached, self.batch_size))
+                )
+            )
+
+            for batch_result in batch_results:
+                for result in batch_result:
+                    self._cache[normalize_description(result.description)] = result.category
+
+            # Evict failure-path "Other" results before anything persists
+            # them, so the next batch/run retries those descriptions.
+            for norm in self._fallback_failures:
+                self._cache.pop(norm, None)
+            self._fallback_failures.clear()
+
+        if uncached or keyword_hits:
+            self._save_cache()
+
+        results = [
+            CategorizedTransaction(
+                date=tx.date,
+                description=tx.description,
+                amount=tx.amount,
+                category=self._cache.get(normalize_description(tx.description), "Other"),
+            )
+            for tx in transactions
+        ]
 
         total_time = time.perf_counter() - total_start
         logger.info(f"[TIMING] Total categorization: {total_time:.2f}s")
 
         return results
 
-    def _categorize_batch(
+    async def _categorize_batch(
         self,
         transactions: list[RawTransaction],
         batch_num: int = 0,
     ) -> list[CategorizedTransaction]:
         """Categorize a batch of transactions using structured output."""
-        system = CATEGORIZE_SYSTEM.format(categories=self.categories.to_prompt_text())
-        transactions_text = "\n".join(f"- {t.description}" for t in transactions)
+        # Prompt each distinct description once; the category map fans the
+        # single answer back out to every duplicate in the batch.
+        unique_descs = list(dict.fromkeys(t.description for t in transactions))
+        transactions_text = "\n".join(f"- {d}" for d in unique_descs)
         prompt = CATEGORIZE_USER.format(transactions=transactions_text)
+        system = self._system_prompt
 
-        self.debug_artifacts.save_json(
-            f"categorize_batch_{batch_num}_request",
-            {"system": system, "prompt": prompt, "schema": self._batch_schema},
-        )
+        # Guard so the payload dict never materializes on non-debug runs
+        if self.debug_artifacts.enabled:
+            self.debug_artifacts.save_json(
+                f"categorize_batch_{batch_num}_request",
+                {"system": system, "prompt": prompt, "schema": self._batch_schema},
+            )
 
         try:
-            response_text = self.client.generate(
+            response_text = await self.client.agenerate(
                 prompt=prompt,
                 system=system,
                 schema=self._batch_schema,
             )
-            response = json.loads(response_text)
+            response = orjson.loads(response_text)
         except OllamaError as e:
             logger.error(f"Batch {batch_num} categorization failed: {e}")
-            return self._categorize_individually(transactions)
-        except json.JSONDecodeError as e:
+            return await self._categorize_individually(transactions)
+        except orjson.JSONDecodeError as e:
             logger.error(f"Batch {batch_num} JSON parse failed: {e}")
-            return self._categorize_individually(transactions)
+            return await self._categorize_individually(transactions)
 
-        self.debug_artifacts.save_json(
-            f"categorize_batch_{batch_num}_response",
-            response,
-        )
+        if self.debug_artifacts.enabled:
+            self.debug_artifacts.save_json(
+                f"categorize_batch_{batch_num}_response",
+                response,
+            )
 
         assignments = response.get("assignments", [])
         category_map = {a["description"]: a["category"] for a in assignments}
+        # Normalize once so matching is insensitive to case/whitespace drift
+        # in the LLM's echoed descriptions.
+        norm_map = {normalize_description(d): c for d, c in category_map.items()}
 
         results: list[CategorizedTransaction] = []
         for transaction in transactions:
-            category = category_map.get(transaction.description)
+            norm_desc = normalize_description(transaction.description)
+            category = category_map.get(transaction.description) or norm_map.get(norm_desc)
 
-            # Try partial match if no exact match
+            # Try partial match if no exact match: single pass over the
+            # normalized assignments checking containment either way.
             if not category:
-                for desc, cat in category_map.items():
-                    if desc in transaction.description or transaction.description in desc:
+                for desc, cat in norm_map.items():
+                    if desc in norm_desc or norm_desc in desc:
                         category = cat
                         break
 
+            # Keyword rules are authoritative per the prompt; try them
+            # before paying for another LLM round-trip.
+            if not category:
+                category = self._match_keywords(transaction.description)
+
             if not category:
                 logger.warning(f"No category match for '{transaction.description}'")
-                category = self._categorize_single(transaction)
+                category = await self._categorize_single(transaction)
 
             results.append(
                 CategorizedTransaction(
@@ -193,47 +401,66 @@ class Categorizer:
 
         return results
 
-    def _categorize_individually(
+    def _match_keywords(self, description: str) -> str | None:
+        """Resolve a category from configured keywords without an LLM call.
+
+        Args:
+            description: Transaction description to match
+
+        Returns:
+            Category name of the longest keyword match, or None
+        """
+        best_len = 0
+        best_category: str | None = None
+        for name, pattern in self._keyword_patterns:
+            match = pattern.search(description)
+            if match and len(match.group()) > best_len:
+                best_len = len(match.group())
+                best_category = name
+        return best_category
+
+    async def _categorize_individually(
         self,
         transactions: list[RawTransaction],
     ) -> list[CategorizedTransaction]:
         """Categorize transactions one at a time (fallback)."""
-        results: list[CategorizedTransaction] = []
-        for transaction in transactions:
-            category = self._categorize_single(transaction)
-            results.append(
-                CategorizedTransaction(
-                    date=transaction.date,
-                    description=transaction.description,
-                    amount=transaction.amount,
-                    category=category,
-                )
+        categories = await asyncio.gather(
+            *(self._categorize_single(transaction) for transaction in transactions)
+        )
+        return [
+            CategorizedTransaction(
+                date=transaction.date,
+                description=transaction.description,
+                amount=transaction.amount,
+                category=category,
             )
-        return results
+            for transaction, category in zip(transactions, categories)
+        ]
 
-    def _categorize_single(self, transaction: RawTransaction) -> str:
+    async def _categorize_single(self, transaction: RawTransaction) -> str:
         """Categorize a single transaction using structured output."""
-        system = CATEGORIZE_SYSTEM.format(categories=self.categories.to_prompt_text())
         prompt = f"Categorize this transaction: {transaction.description}"
 
         try:
-            response_text = self.client.generate(
+            response_text = await self.client.agenerate(
                 prompt=prompt,
-                system=system,
+                system=self._system_prompt,
                 schema=self._single_schema,
             )
-            response = json.loads(response_text)
+            response = orjson.loads(response_text)
             category = response.get("category")
             if category:
                 return category
-        except (OllamaError, json.JSONDecodeError) as e:
+        except (OllamaError, orjson.JSONDecodeError) as e:
             logger.warning(f"Single categorization failed for '{transaction.description}': {e}")
 
         logger.warning(f"Defaulting to 'Other' for: {transaction.description}")
+        self._fallback_failures.add(normalize_description(transaction.description))
         return "Other"
 
     @staticmethod
     def _batch(items: list, size: int):
         """Yield successive batches of items."""
-        for i in range(0, len(items), size):
-            yield items[i : i + size]
+        it = iter(items)
+        while batch := list(islice(it, size)):
+            yield batch
@@ -1,9 +1,10 @@
 """CLI modules for transactions categorizer."""
 
-import json
 import sys
+from functools import lru_cache
 from pathlib import Path
 
+import orjson
 from loguru import logger
 
 from src.models import CategoriesConfig
@@ -12,6 +13,17 @@ from src.models import CategoriesConfig
 DEFAULT_CATEGORIES_PATH = Path(__file__).parent.parent.parent / "categories" / "default.json"
 
 
+@lru_cache(maxsize=8)
+def _load_categories_cached(path_str: str, mtime_ns: int) -> CategoriesConfig:
+    """Parse a categories file, cached on (path, mtime).
+
+    The mtime key means an edited file reloads while repeated loads of an
+    unchanged file (library use, multiple CLI helpers) parse once.
+    """
+    data = orjson.loads(Path(path_str).read_bytes())
+    return CategoriesConfig.model_validate(data)
+
+
 def load_categories(categories_path: Path | None, required: bool = True) -> CategoriesConfig | None:
     """Load categories from JSON file or use defaults.
 
@@ -37,9 +49,9 @@ def load_categories(categories_path: Path | None, required: bool = True) -> Cate
         return None
 
     try:
-        with open(categories_path) as f:
-            data = json.load(f)
-        return CategoriesConfig.model_validate(data)
-    except (json.JSONDecodeError, ValueError) as e:
+        return _load_categories_cached(
+            str(categories_path), categories_path.stat().st_mtime_ns
+        )
+    except (orjson.JSONDecodeError, ValueError) as e:
         logger.error(f"Failed to parse categories file: {e}")
         sys.exit(1)
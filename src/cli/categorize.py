@@ -8,6 +8,7 @@ from loguru import logger
 
 from src.cli import load_categories
 from src.cli.summarize import generate_summary
+from src.categorizer import DEFAULT_CONCURRENCY
 from src.logging_config import DebugArtifacts, configure_logging
 from src.pipeline import Pipeline
 
@@ -73,6 +74,23 @@ Examples:
         default="localhost:11434",
         help="Ollama server address (default: localhost:11434)",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help="Max concurrent Ollama categorization requests (default: OLLAMA_NUM_PARALLEL or 4)",
+    )
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        default=Path.home() / ".cache" / "budget-automation" / "categorize.json",
+        help="Path to the persistent description->category cache (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Disable the persistent categorization cache",
+    )
     parser.add_argument(
         "--summary",
         action="store_true",
@@ -135,7 +153,9 @@ def main() -> int:
             ollama_host=ollama_host,
             ollama_port=ollama_port,
             ollama_model=args.ollama_model,
+            concurrency=args.concurrency or DEFAULT_CONCURRENCY,
             debug_artifacts=debug_artifacts,
+            cache_path=None if args.no_cache else args.cache,
         ) as pipeline:
             # Process PDFs
             transactions = pipeline.process(
@@ -1,11 +1,17 @@
 """Google Sheets API client using gspread."""
 
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
 from pathlib import Path
+from typing import TYPE_CHECKING, Iterator
 
-import gspread
-from google.oauth2.service_account import Credentials
 from loguru import logger
 
+if TYPE_CHECKING:
+    import gspread
+
 # Default credentials path
 DEFAULT_CREDENTIALS_PATH = Path.home() / ".config" / "budget-automation" / "credentials.json"
 
@@ -14,6 +20,81 @@ SCOPES = [
     "https://www.googleapis.com/auth/spreadsheets",
 ]
 
+# How long cached spreadsheet/worksheet handles stay valid
+CACHE_TTL_SECONDS = 300.0
+
+# How long cached cell values stay valid; short because other writers
+# may touch the sheet between runs
+VALUE_CACHE_TTL_SECONDS = 60.0
+
+# Column-letter lookup table (A/a -> 1 ... Z/z -> 26), so address
+# parsing needs no regex or per-character branching
+_COL_TABLE = [0] * 256
+for _i, _c in enumerate(b"ABCDEFGHIJKLMNOPQRSTUVWXYZ", 1):
+    _COL_TABLE[_c] = _i
+    _COL_TABLE[_c + 32] = _i
+del _i, _c
+
+
+def _parse_cell_address(cell: str) -> tuple[int, int] | None:
+    """Parse an A1 address like "M4" into (row, col), 1-based, or None."""
+    table = _COL_TABLE
+    col = 0
+    i = 0
+    n = len(cell)
+    while i < n and (o := ord(cell[i])) < 256 and (v := table[o]):
+        col = col * 26 + v
+        i += 1
+    if col == 0 or i == n or not cell[i:].isdigit():
+        return None
+    return int(cell[i:]), col
+
+
+def _coalesce_updates(updates: dict[str, float | str]) -> list[dict]:
+    """Group cell updates into contiguous per-column range blocks.
+
+    Vertical runs like M4..M9 collapse into one {"range": "M4:M9"}
+    entry, which shrinks the batch_update payload for the
+    column-per-month layout budget sheets use. Unparseable addresses
+    pass through as single-cell ranges.
+    """
+    by_col: dict[int, list[tuple[int, float | str]]] = {}
+    batch_data: list[dict] = []
+
+    for cell, value in updates.items():
+        parsed = _parse_cell_address(cell)
+        if parsed is None:
+            batch_data.append({"range": cell, "values": [[value]]})
+        else:
+            by_col.setdefault(parsed[1], []).append((parsed[0], value))
+
+    for col, entries in by_col.items():
+        entries.sort()
+        start = 0
+        for i in range(1, len(entries) + 1):
+            if i == len(entries) or entries[i][0] != entries[i - 1][0] + 1:
+                run = entries[start:i]
+                first = _rowcol_to_a1(run[0][0], col)
+                if len(run) == 1:
+                    batch_data.append({"range": first, "values": [[run[0][1]]]})
+                else:
+                    last = _rowcol_to_a1(run[-1][0], col)
+                    batch_data.append(
+                        {"range": f"{first}:{last}", "values": [[v] for _, v in run]}
+                    )
+                start = i
+
+    return batch_data
+
+
+def _rowcol_to_a1(row: int, col: int) -> str:
+    """Inverse of _parse_cell_address: 1-based (row, col) -> "M4"."""
+    letters = ""
+    while col:
+        col, rem = divmod(col - 1, 26)
+        letters = chr(ord("A") + rem) + letters
+    return f"{letters}{row}"
+
 
 class GSheetsError(Exception):
     """Error communicating with Google Sheets."""
@@ -35,9 +116,27 @@ class GSheetsClient:
         """
         self.credentials_path = credentials_path or DEFAULT_CREDENTIALS_PATH
         self._client: gspread.Client | None = None
+        # TTL caches: every cell op otherwise re-fetches spreadsheet
+        # metadata via open_by_key/worksheet — pure quota burn
+        self._ss_cache: dict[str, tuple[float, gspread.Spreadsheet]] = {}
+        self._ws_cache: dict[tuple[str, str | None], tuple[float, gspread.Worksheet]] = {}
+        # Buffered writes while inside a batch() block, keyed by worksheet
+        # identity: id -> (worksheet, {cell: value})
+        self._pending_writes: dict[int, tuple[gspread.Worksheet, dict[str, float | str]]] | None = None
+        # Cell-value cache keyed by (worksheet id, cell); serves repeated
+        # reads (e.g. back-to-back dry runs) and is dropped on write
+        self._cell_cache: dict[tuple[int, str], tuple[float, str | None]] = {}
 
     def _ensure_client(self) -> gspread.Client:
         """Get or create the gspread client."""
+        # Deferred: gspread and google-auth are slow imports that only
+        # the upload path needs; binding them as module globals here
+        # keeps the except clauses below working unchanged.
+        global gspread, Credentials, HTTPAdapter
+        import gspread
+        from google.oauth2.service_account import Credentials
+        from requests.adapters import HTTPAdapter
+
         if self._client is None:
             if not self.credentials_path.exists():
                 raise GSheetsError(
@@ -54,7 +153,19 @@ class GSheetsClient:
                     str(self.credentials_path),
                     scopes=SCOPES,
                 )
-                self._client = gspread.authorize(creds)
+                # BackOffHTTPClient retries transient 429/5xx responses
+                # with exponential backoff instead of surfacing them as
+                # hard GSheetsErrors mid-upload.
+                self._client = gspread.authorize(
+                    creds,
+                    http_client=gspread.http_client.BackOffHTTPClient,
+                )
+                # Enlarge the session pool (requests defaults to 10) so
+                # concurrent callers don't churn connections to the
+                # single sheets.googleapis.com origin. Retries are
+                # already handled by BackOffHTTPClient.
+                adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32)
+                self._client.http_client.session.mount("https://", adapter)
                 logger.debug("Authenticated with Google Sheets API")
             except Exception as e:
                 raise GSheetsError(f"Failed to authenticate: {e}") from e
@@ -70,10 +181,15 @@ class GSheetsClient:
         Returns:
             gspread Spreadsheet object
         """
+        cached = self._ss_cache.get(spreadsheet_id)
+        if cached is not None and time.monotonic() - cached[0] < CACHE_TTL_SECONDS:
+            return cached[1]
+
         client = self._ensure_client()
         try:
             spreadsheet = client.open_by_key(spreadsheet_id)
             logger.debug(f"Opened spreadsheet: {spreadsheet.title}")
+            self._ss_cache[spreadsheet_id] = (time.monotonic(), spreadsheet)
             return spreadsheet
         except gspread.SpreadsheetNotFound:
             raise GSheetsError(
@@ -97,6 +213,11 @@ class GSheetsClient:
         Returns:
             gspread Worksheet object
         """
+        cache_key = (spreadsheet_id, sheet_name)
+        cached = self._ws_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < CACHE_TTL_SECONDS:
+            return cached[1]
+
         spreadsheet = self.open_spreadsheet(spreadsheet_id)
 
         try:
@@ -105,6 +226,7 @@ class GSheetsClient:
             else:
                 worksheet = spreadsheet.sheet1
             logger.debug(f"Using worksheet: {worksheet.title}")
+            self._ws_cache[cache_key] = (time.monotonic(), worksheet)
             return worksheet
         except gspread.WorksheetNotFound:
             available = [ws.title for ws in spreadsheet.worksheets()]
@@ -146,22 +268,89 @@ class GSheetsClient:
         if not cells:
             return {}
 
+        ws_id = worksheet.id
+        now = time.monotonic()
+        cached = [self._cell_cache.get((ws_id, cell)) for cell in cells]
+        if all(e is not None and now - e[0] < VALUE_CACHE_TTL_SECONDS for e in cached):
+            logger.debug(f"Cell cache hit for {len(cells)} cells")
+            return {cell: e[1] for cell, e in zip(cells, cached)}
+
         try:
-            # Use batch_get for efficiency
-            ranges = cells
-            results = worksheet.batch_get(ranges)
-
-            values = {}
-            for cell, result in zip(cells, results):
-                if result and result[0]:
-                    values[cell] = result[0][0]
+            # If the cells sit in a tight bounding box, fetch it as one
+            # range and index into the grid instead of asking for N ranges
+            parsed = [_parse_cell_address(cell) for cell in cells]
+            if all(parsed):
+                rows = [p[0] for p in parsed]
+                cols = [p[1] for p in parsed]
+                min_row, max_row = min(rows), max(rows)
+                min_col, max_col = min(cols), max(cols)
+                area = (max_row - min_row + 1) * (max_col - min_col + 1)
+                if area <= max(len(cells) * 4, 64):
+                    grid = worksheet.get(
+                        f"{_rowcol_to_a1(min_row, min_col)}:{_rowcol_to_a1(max_row, max_col)}"
+                    )
+                    values = {
+                        cell: (
+                            grid[r - min_row][c - min_col]
+                            if r - min_row < len(grid) and c - min_col < len(grid[r - min_row])
+                            else None
+                        )
+                        or None
+                        for cell, (r, c) in zip(cells, parsed)
+                    }
                 else:
-                    values[cell] = None
-
-            return values
+                    values = None
+            else:
+                values = None
+
+            if values is None:
+                results = worksheet.batch_get(cells)
+                values = {
+                    cell: (result[0][0] if result and result[0] else None)
+                    for cell, result in zip(cells, results)
+                }
         except gspread.APIError as e:
             raise GSheetsError(f"Failed to read cells: {e}") from e
 
+        for cell, value in values.items():
+            self._cell_cache[(ws_id, cell)] = (now, value)
+        return values
+
+    def invalidate(self, spreadsheet_id: str) -> None:
+        """Drop cached handles for a spreadsheet.
+
+        Call after out-of-band structural changes (sheets added/removed)
+        so the next lookup re-fetches fresh metadata.
+
+        Args:
+            spreadsheet_id: The spreadsheet ID to evict
+        """
+        self._ss_cache.pop(spreadsheet_id, None)
+        for key in [k for k in self._ws_cache if k[0] == spreadsheet_id]:
+            del self._ws_cache[key]
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Buffer cell writes and flush them as one request per worksheet.
+
+        Inside the block, `write_cell`/`write_cells` queue their updates
+        instead of issuing an HTTP request each; on clean exit the queued
+        cells are sent as a single `batch_update` per worksheet. If the
+        block raises, pending writes are discarded. Reads are unaffected.
+        """
+        if self._pending_writes is not None:
+            raise GSheetsError("Nested batch() blocks are not supported")
+
+        self._pending_writes = {}
+        try:
+            yield
+            pending = self._pending_writes
+            self._pending_writes = None
+            for worksheet, updates in pending.values():
+                self.write_cells(worksheet, updates)
+        finally:
+            self._pending_writes = None
+
     def write_cell(
         self,
         worksheet: gspread.Worksheet,
@@ -170,13 +359,21 @@ class GSheetsClient:
     ) -> None:
         """Write a single cell value.
 
+        Inside a `batch()` block the write is queued instead of sent.
+
         Args:
             worksheet: The worksheet to write to
             cell: Cell address (e.g., "A1", "M4")
             value: Value to write
         """
+        if self._pending_writes is not None:
+            _, updates = self._pending_writes.setdefault(id(worksheet), (worksheet, {}))
+            updates[cell] = value
+            return
+
         try:
             worksheet.update_acell(cell, value)
+            self._cell_cache.pop((worksheet.id, cell), None)
             logger.debug(f"Updated {cell} = {value}")
         except gspread.APIError as e:
             raise GSheetsError(f"Failed to write cell {cell}: {e}") from e
@@ -188,6 +385,8 @@ class GSheetsClient:
     ) -> None:
         """Write multiple cell values in a batch.
 
+        Inside a `batch()` block the writes are queued instead of sent.
+
         Args:
             worksheet: The worksheet to write to
             updates: Dict mapping cell address to value
@@ -195,13 +394,16 @@ class GSheetsClient:
         if not updates:
             return
 
+        if self._pending_writes is not None:
+            _, pending = self._pending_writes.setdefault(id(worksheet), (worksheet, {}))
+            pending.update(updates)
+            return
+
         try:
-            # Format for batch_update
-            batch_data = [
-                {"range": cell, "values": [[value]]}
-                for cell, value in updates.items()
-            ]
+            batch_data = _coalesce_updates(updates)
             worksheet.batch_update(batch_data)
+            for cell in updates:
+                self._cell_cache.pop((worksheet.id, cell), None)
             logger.debug(f"Batch updated {len(updates)} cells")
         except gspread.APIError as e:
             raise GSheetsError(f"Failed to batch update cells: {e}") from e
@@ -246,6 +448,8 @@ class GSheetsClient:
         try:
             new_sheet = source.duplicate(new_sheet_name=new_sheet_name)
             logger.info(f"Created new sheet '{new_sheet_name}' from template '{source_sheet_name}'")
+            # The cached spreadsheet metadata no longer lists all sheets
+            self.invalidate(spreadsheet_id)
             return new_sheet
         except gspread.APIError as e:
             raise GSheetsError(f"Failed to duplicate sheet: {e}") from e
@@ -1,14 +1,21 @@
 """Ollama API client for local LLM inference."""
 
+from __future__ import annotations
+
+import asyncio
 import base64
 import io
-import json
-from typing import Any
+import threading
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Iterator, Literal
 
 import httpx
+import orjson
 from loguru import logger
-from PIL import Image
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
+
+if TYPE_CHECKING:
+    from PIL import Image
 
 
 class OllamaError(Exception):
@@ -17,6 +24,21 @@ class OllamaError(Exception):
     pass
 
 
+@lru_cache(maxsize=64)
+def _schema_for(model_cls: type[BaseModel]) -> dict:
+    """JSON schema for a Pydantic model, built once per class."""
+    return model_cls.model_json_schema()
+
+
+# Connection pool sizing shared by the sync and async HTTP clients;
+# keep-alive connections avoid a TCP handshake per generate call.
+_POOL_LIMITS = httpx.Limits(max_keepalive_connections=16, max_connections=16)
+
+# Bodies are pre-serialized with orjson (faster than the stdlib encoder
+# httpx would use for json=, notably for base64 image payloads)
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
 class OllamaClient:
     """Client for Ollama local LLM API."""
 
@@ -26,36 +48,54 @@ class OllamaClient:
         port: int = 11434,
         model: str = "mistral",
         timeout: float = 600.0,
+        keep_alive: str = "30m",
     ):
         self.base_url = f"http://{host}:{port}"
         self.model = model
         self.timeout = timeout
-        self._client = httpx.Client(timeout=timeout)
-
-    def generate(
+        # Sent with every request so the model (and its prompt cache) stays
+        # resident between calls instead of reloading per request
+        self.keep_alive = keep_alive
+        self._client = httpx.Client(timeout=timeout, limits=_POOL_LIMITS)
+        self._async_client: httpx.AsyncClient | None = None
+        self._async_client_loop: asyncio.AbstractEventLoop | None = None
+        # Reused across generate_vision calls so per-page encoding doesn't
+        # allocate and free a multi-MB buffer each time
+        self._img_buffer = io.BytesIO()
+        self._img_lock = threading.Lock()
+
+    def _ensure_async_client(self) -> httpx.AsyncClient:
+        """Get or create the async HTTP client for the running event loop.
+
+        Callers like Categorizer.categorize() wrap each call in its own
+        asyncio.run(), so a client created under an earlier (now closed)
+        loop cannot be reused — its keep-alive connections are bound to
+        that loop and the next request dies with "Event loop is closed".
+        Recreate the client whenever the running loop changes; the stale
+        one is dropped for GC since its loop can no longer run aclose().
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is not None and self._async_client_loop is not loop:
+            self._async_client = None
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(timeout=self.timeout, limits=_POOL_LIMITS)
+            self._async_client_loop = loop
+        return self._async_client
+
+    def _build_payload(
         self,
         prompt: str,
         system: str | None = None,
         temperature: float = 0.1,
         format_json: bool = False,
         schema: dict | None = None,
-    ) -> str:
-        """Generate a completion from the model.
-
-        Args:
-            prompt: The user prompt
-            system: Optional system prompt
-            temperature: Sampling temperature (lower = more deterministic)
-            format_json: Whether to request JSON output format
-            schema: Optional JSON schema for structured output
-
-        Returns:
-            The model's response text
-        """
+    ) -> dict[str, Any]:
+        """Build the request payload for /api/generate."""
         payload: dict[str, Any] = {
             "model": self.model,
             "prompt": prompt,
             "stream": False,
+            "keep_alive": self.keep_alive,
             "options": {
                 "temperature": temperature,
                 "num_predict": 8192,  # Enough for ~150+ transactions
@@ -72,15 +112,97 @@ class OllamaClient:
         elif format_json:
             payload["format"] = "json"
 
-        logger.debug(
-            f"Ollama request: model={self.model}, prompt_len={len(prompt)}, "
-            f"system_len={len(system) if system else 0}, schema={'yes' if schema else 'no'}"
+        # lazy=True skips even argument evaluation unless DEBUG is enabled
+        logger.opt(lazy=True).debug(
+            "Ollama request: model={}, prompt_len={}, system_len={}, schema={}",
+            lambda: self.model,
+            lambda: len(prompt),
+            lambda: len(system) if system else 0,
+            lambda: "yes" if schema else "no",
         )
 
+        return payload
+
+    @staticmethod
+    def _format_timings(data: dict, result: str) -> str:
+        """Render the timing breakdown of an Ollama reply (all ns)."""
+        total_ns = data.get("total_duration", 0)
+        load_ns = data.get("load_duration", 0)
+        prompt_eval_ns = data.get("prompt_eval_duration", 0)
+        eval_ns = data.get("eval_duration", 0)
+        return (
+            f"len={len(result)}, "
+            f"prompt_tokens={data.get('prompt_eval_count')}, eval_tokens={data.get('eval_count')}, "
+            f"total={total_ns/1e9:.2f}s (prompt={prompt_eval_ns/1e9:.2f}s, eval={eval_ns/1e9:.2f}s, load={load_ns/1e9:.2f}s)"
+        )
+
+    def _extract_response(self, data: dict) -> str:
+        """Pull the response text out of an Ollama reply and log timings."""
+        result = data.get("response", "")
+
+        logger.opt(lazy=True).debug(
+            "Ollama response: {}", lambda: self._format_timings(data, result)
+        )
+
+        return result
+
+    def warmup(self, keep_alive: str | None = None) -> None:
+        """Pre-load the model and warm the HTTP connection.
+
+        Fires a minimal generate request so the model is resident (and kept
+        alive per OLLAMA_KEEP_ALIVE semantics) before the first real call.
+        Failures are logged and ignored — the first real request will
+        surface any connection problem.
+
+        Args:
+            keep_alive: How long Ollama should keep the model loaded
+                (defaults to the client's keep_alive setting)
+        """
+        payload: dict[str, Any] = {
+            "model": self.model,
+            "prompt": " ",
+            "stream": False,
+            "keep_alive": keep_alive or self.keep_alive,
+            "options": {"num_predict": 1},
+        }
+        try:
+            response = self._client.post(
+                f"{self.base_url}/api/generate",
+                content=orjson.dumps(payload),
+                headers=_JSON_HEADERS,
+            )
+            response.raise_for_status()
+            logger.debug(f"Ollama warmup complete: model={self.model}")
+        except httpx.HTTPError as e:
+            logger.debug(f"Ollama warmup failed (ignored): {e}")
+
+    def generate(
+        self,
+        prompt: str,
+        system: str | None = None,
+        temperature: float = 0.1,
+        format_json: bool = False,
+        schema: dict | None = None,
+    ) -> str:
+        """Generate a completion from the model.
+
+        Args:
+            prompt: The user prompt
+            system: Optional system prompt
+            temperature: Sampling temperature (lower = more deterministic)
+            format_json: Whether to request JSON output format
+            schema: Optional JSON schema for structured output
+
+        Returns:
+            The model's response text
+        """
+        payload = self._build_payload(prompt, system, temperature, format_json, schema)
+
         try:
             response = self._client.post(
                 f"{self.base_url}/api/generate",
-                json=payload,
+                content=orjson.dumps(payload),
+                headers=_JSON_HEADERS,
             )
             response.raise_for_status()
         except httpx.HTTPStatusError as e:
@@ -90,22 +212,95 @@ class OllamaClient:
             logger.error(f"Ollama connection error: {e}")
             raise OllamaError(f"Failed to connect to Ollama: {e}") from e
 
-        data = response.json()
-        result = data.get("response", "")
+        return self._extract_response(orjson.loads(response.content))
 
-        # Timing breakdown (all in nanoseconds from Ollama)
-        total_ns = data.get("total_duration", 0)
-        load_ns = data.get("load_duration", 0)
-        prompt_eval_ns = data.get("prompt_eval_duration", 0)
-        eval_ns = data.get("eval_duration", 0)
+    async def agenerate(
+        self,
+        prompt: str,
+        system: str | None = None,
+        temperature: float = 0.1,
+        format_json: bool = False,
+        schema: dict | None = None,
+    ) -> str:
+        """Async variant of generate() for concurrent requests.
 
-        logger.debug(
-            f"Ollama response: len={len(result)}, "
-            f"prompt_tokens={data.get('prompt_eval_count')}, eval_tokens={data.get('eval_count')}, "
-            f"total={total_ns/1e9:.2f}s (prompt={prompt_eval_ns/1e9:.2f}s, eval={eval_ns/1e9:.2f}s, load={load_ns/1e9:.2f}s)"
-        )
+        Ollama serves concurrent generations when OLLAMA_NUM_PARALLEL > 1,
+        so callers can overlap multiple batches via asyncio.gather.
 
-        return result
+        Args:
+            prompt: The user prompt
+            system: Optional system prompt
+            temperature: Sampling temperature (lower = more deterministic)
+            format_json: Whether to request JSON output format
+            schema: Optional JSON schema for structured output
+
+        Returns:
+            The model's response text
+        """
+        payload = self._build_payload(prompt, system, temperature, format_json, schema)
+        client = self._ensure_async_client()
+
+        try:
+            response = await client.post(
+                f"{self.base_url}/api/generate",
+                content=orjson.dumps(payload),
+                headers=_JSON_HEADERS,
+            )
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            logger.error(f"Ollama HTTP error: {e.response.status_code}")
+            raise OllamaError(f"Ollama HTTP error: {e.response.status_code}") from e
+        except httpx.RequestError as e:
+            logger.error(f"Ollama connection error: {e}")
+            raise OllamaError(f"Failed to connect to Ollama: {e}") from e
+
+        return self._extract_response(orjson.loads(response.content))
+
+    def generate_stream(
+        self,
+        prompt: str,
+        system: str | None = None,
+        temperature: float = 0.1,
+    ) -> Iterator[str]:
+        """Stream a completion, yielding text chunks as they arrive.
+
+        Avoids holding the full response in memory and gives callers
+        time-to-first-token; structured/schema calls should keep using
+        generate() since the schema is enforced over the whole reply.
+
+        Args:
+            prompt: The user prompt
+            system: Optional system prompt
+            temperature: Sampling temperature
+
+        Yields:
+            Response text fragments in generation order
+        """
+        payload = self._build_payload(prompt, system, temperature)
+        payload["stream"] = True
+
+        try:
+            with self._client.stream(
+                "POST",
+                f"{self.base_url}/api/generate",
+                content=orjson.dumps(payload),
+                headers=_JSON_HEADERS,
+            ) as response:
+                response.raise_for_status()
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    chunk = orjson.loads(line)
+                    if text := chunk.get("response", ""):
+                        yield text
+                    if chunk.get("done"):
+                        break
+        except httpx.HTTPStatusError as e:
+            logger.error(f"Ollama HTTP error: {e.response.status_code}")
+            raise OllamaError(f"Ollama HTTP error: {e.response.status_code}") from e
+        except httpx.RequestError as e:
+            logger.error(f"Ollama connection error: {e}")
+            raise OllamaError(f"Failed to connect to Ollama: {e}") from e
 
     def generate_structured[T: BaseModel](
         self,
@@ -125,8 +320,8 @@ class OllamaClient:
         Returns:
             Validated Pydantic model instance
         """
-        # Get JSON schema from Pydantic model
-        schema = response_model.model_json_schema()
+        # Get JSON schema from Pydantic model (cached per class)
+        schema = _schema_for(response_model)
 
         response = self.generate(
             prompt=prompt,
@@ -136,12 +331,43 @@ class OllamaClient:
         )
 
         try:
-            data = json.loads(response)
-            return response_model.model_validate(data)
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON parse error: {e}, response preview: {response[:200]}")
-            raise OllamaError(f"Failed to parse JSON response: {e}") from e
-        except Exception as e:
+            # Parses and validates in one pass — no intermediate dict
+            return response_model.model_validate_json(response)
+        except ValidationError as e:
+            logger.error(f"Validation error: {e}, response preview: {response[:200]}")
+            raise OllamaError(f"Failed to validate response: {e}") from e
+
+    async def agenerate_structured[T: BaseModel](
+        self,
+        prompt: str,
+        response_model: type[T],
+        system: str | None = None,
+        temperature: float = 0.1,
+    ) -> T:
+        """Async variant of generate_structured() for concurrent requests.
+
+        Args:
+            prompt: The user prompt
+            response_model: Pydantic model class for the response
+            system: Optional system prompt
+            temperature: Sampling temperature
+
+        Returns:
+            Validated Pydantic model instance
+        """
+        schema = _schema_for(response_model)
+
+        response = await self.agenerate(
+            prompt=prompt,
+            system=system,
+            temperature=temperature,
+            schema=schema,
+        )
+
+        try:
+            # Parses and validates in one pass — no intermediate dict
+            return response_model.model_validate_json(response)
+        except ValidationError as e:
             logger.error(f"Validation error: {e}, response preview: {response[:200]}")
             raise OllamaError(f"Failed to validate response: {e}") from e
 
@@ -169,8 +395,8 @@ class OllamaClient:
         )
 
         try:
-            return json.loads(response)
-        except json.JSONDecodeError as e:
+            return orjson.loads(response)
+        except orjson.JSONDecodeError as e:
             logger.error(f"JSON parse error: {e}, response preview: {response[:200]}")
             raise OllamaError(f"Failed to parse JSON response: {e}") from e
 
@@ -181,6 +407,7 @@ class OllamaClient:
         system: str | None = None,
         temperature: float = 0.1,
         format_json: bool = False,
+        image_format: Literal["PNG", "JPEG"] = "JPEG",
     ) -> str:
         """Generate a completion from a vision model with an image.
 
@@ -190,23 +417,46 @@ class OllamaClient:
             system: Optional system prompt
             temperature: Sampling temperature
             format_json: Whether to request JSON output format
+            image_format: Wire encoding; JPEG (quality 85) is several
+                times smaller than PNG for scanned pages with no
+                practical extraction-quality loss. Use PNG for
+                synthetic/line-art images where JPEG artifacts matter.
 
         Returns:
             The model's response text
         """
-        # Convert PIL image to base64
-        if image.mode != "RGB":
+        # Deferred: Pillow is only needed on the vision path, and it's a
+        # slow import the text-only pipeline shouldn't pay for
+        from PIL import Image
+
+        # Normalize mode without needless full-frame copies: JPEG/PNG
+        # encode grayscale natively, and RGBA flattens onto white rather
+        # than a blind convert that black-fills transparency
+        if image.mode == "RGBA":
+            background = Image.new("RGB", image.size, (255, 255, 255))
+            background.paste(image, mask=image.split()[3])
+            image = background
+        elif image.mode not in ("RGB", "L"):
             image = image.convert("RGB")
 
-        buffer = io.BytesIO()
-        image.save(buffer, format="PNG")
-        image_base64 = base64.b64encode(buffer.getvalue()).decode("utf-8")
+        with self._img_lock:
+            buffer = self._img_buffer
+            buffer.seek(0)
+            buffer.truncate(0)
+            if image_format == "JPEG":
+                image.save(buffer, format="JPEG", quality=85, optimize=True)
+            else:
+                image.save(buffer, format="PNG")
+            # getbuffer() avoids the bytes copy getvalue() makes, and ascii
+            # decode is cheaper than utf-8 for pure-ASCII base64
+            image_base64 = base64.b64encode(buffer.getbuffer()).decode("ascii")
 
         payload: dict[str, Any] = {
             "model": self.model,
             "prompt": prompt,
             "images": [image_base64],
             "stream": False,
+            "keep_alive": self.keep_alive,
             "options": {
                 "temperature": temperature,
             },
@@ -218,14 +468,18 @@ class OllamaClient:
         if format_json:
             payload["format"] = "json"
 
-        logger.debug(
-            f"Ollama vision request: model={self.model}, prompt_len={len(prompt)}, image_size={image.size}"
+        logger.opt(lazy=True).debug(
+            "Ollama vision request: model={}, prompt_len={}, image_size={}",
+            lambda: self.model,
+            lambda: len(prompt),
+            lambda: image.size,
         )
 
         try:
             response = self._client.post(
                 f"{self.base_url}/api/generate",
-                json=payload,
+                content=orjson.dumps(payload),
+                headers=_JSON_HEADERS,
             )
             response.raise_for_status()
         except httpx.HTTPStatusError as e:
@@ -235,19 +489,11 @@ class OllamaClient:
             logger.error(f"Ollama connection error: {e}")
             raise OllamaError(f"Failed to connect to Ollama: {e}") from e
 
-        data = response.json()
+        data = orjson.loads(response.content)
         result = data.get("response", "")
 
-        # Timing breakdown (all in nanoseconds from Ollama)
-        total_ns = data.get("total_duration", 0)
-        load_ns = data.get("load_duration", 0)
-        prompt_eval_ns = data.get("prompt_eval_duration", 0)
-        eval_ns = data.get("eval_duration", 0)
-
-        logger.debug(
-            f"Ollama vision response: len={len(result)}, "
-            f"prompt_tokens={data.get('prompt_eval_count')}, eval_tokens={data.get('eval_count')}, "
-            f"total={total_ns/1e9:.2f}s (prompt={prompt_eval_ns/1e9:.2f}s, eval={eval_ns/1e9:.2f}s, load={load_ns/1e9:.2f}s)"
+        logger.opt(lazy=True).debug(
+            "Ollama vision response: {}", lambda: self._format_timings(data, result)
         )
 
         return result
@@ -279,8 +525,8 @@ class OllamaClient:
         )
 
         try:
-            return json.loads(response)
-        except json.JSONDecodeError as e:
+            return orjson.loads(response)
+        except orjson.JSONDecodeError as e:
             logger.error(f"JSON parse error: {e}, response preview: {response[:200]}")
             raise OllamaError(f"Failed to parse JSON response: {e}") from e
 
@@ -307,8 +553,18 @@ class OllamaClient:
             return False
 
     def close(self) -> None:
-        """Close the HTTP client."""
+        """Close the HTTP clients."""
         self._client.close()
+        if self._async_client is not None:
+            try:
+                asyncio.run(self._async_client.aclose())
+            except RuntimeError:
+                # Called from within a running event loop, or the client's
+                # own loop is already closed; its connections are released
+                # when that loop shuts down (or via GC).
+                pass
+            self._async_client = None
+            self._async_client_loop = None
 
     def __enter__(self) -> "OllamaClient":
         return self
@@ -101,11 +101,11 @@ class DebugArtifacts:
         Returns:
             Path to saved file, or None if disabled
         """
-        import json
+        import orjson
 
         if not self.enabled or not self.output_dir:
             return None
         path = self.output_dir / f"{name}.json"
-        path.write_text(json.dumps(data, indent=2, default=str))
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str))
         logger.debug(f"Saved debug JSON: {path}")
         return path
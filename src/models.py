@@ -2,21 +2,50 @@
 
 from datetime import date
 from decimal import Decimal
+from functools import cached_property
+from typing import Iterable
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 
 class RawTransaction(BaseModel):
-    """Transaction extracted from PDF before categorization."""
+    """Transaction extracted from PDF before categorization.
+
+    Frozen so instances are safe set/dict keys; the dedup hash is
+    computed once and cached.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     date: date
     description: str
     amount: Decimal
     raw_text: str = Field(default="", description="Original text for debugging")
 
+    _hash: int | None = PrivateAttr(default=None)
+
+    @cached_property
+    def amount_cents(self) -> int:
+        """Amount as integer cents; int hashing/summing beats Decimal."""
+        return int((self.amount * 100).to_integral_value())
+
     def __hash__(self) -> int:
-        """Hash for deduplication."""
-        return hash((self.date, self.description, self.amount))
+        """Hash for deduplication (cached; raw_text excluded)."""
+        if self._hash is None:
+            self._hash = hash((self.date.toordinal(), self.description, self.amount_cents))
+        return self._hash
+
+    @classmethod
+    def dedup(cls, transactions: Iterable["RawTransaction"]) -> list["RawTransaction"]:
+        """Deduplicate transactions, keeping the first occurrence.
+
+        Buckets on a primitive (ordinal date, description, cents) key,
+        which probes faster than hashing model instances in a set.
+        """
+        unique: dict[tuple[int, str, int], RawTransaction] = {}
+        for tx in transactions:
+            unique.setdefault((tx.date.toordinal(), tx.description, tx.amount_cents), tx)
+        return list(unique.values())
 
     def __eq__(self, other: object) -> bool:
         """Equality check for deduplication."""
@@ -37,6 +66,11 @@ class CategorizedTransaction(BaseModel):
     amount: Decimal
     category: str
 
+    @cached_property
+    def amount_cents(self) -> int:
+        """Amount as integer cents; int summing beats Decimal/float."""
+        return int((self.amount * 100).to_integral_value())
+
     def to_csv_row(self) -> dict[str, str]:
         """Convert to CSV row dict."""
         return {
@@ -60,12 +94,15 @@ class CategoriesConfig(BaseModel):
 
     categories: list[Category]
 
-    def get_category_names(self) -> list[str]:
-        """Get list of category names."""
+    # Both derived views are cached: configs are loaded once and never
+    # mutated, but the prompt text and name list are requested per batch.
+
+    @cached_property
+    def _category_names(self) -> list[str]:
         return [c.name for c in self.categories]
 
-    def to_prompt_text(self) -> str:
-        """Format categories for LLM prompt."""
+    @cached_property
+    def _prompt_text(self) -> str:
         lines = []
         for cat in self.categories:
             line = f"- {cat.name}: {cat.description}"
@@ -74,6 +111,14 @@ class CategoriesConfig(BaseModel):
             lines.append(line)
         return "\n".join(lines)
 
+    def get_category_names(self) -> list[str]:
+        """Get list of category names."""
+        return self._category_names
+
+    def to_prompt_text(self) -> str:
+        """Format categories for LLM prompt."""
+        return self._prompt_text
+
 
 # LLM Response Schemas for structured output
 
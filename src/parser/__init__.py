@@ -2,5 +2,6 @@
 
 from src.parser.base import BaseParser
 from src.parser.pdfplumber_parser import PdfPlumberParser
+from src.parser.pypdf_parser import FastPypdfParser
 
-__all__ = ["BaseParser", "PdfPlumberParser"]
+__all__ = ["BaseParser", "FastPypdfParser", "PdfPlumberParser"]
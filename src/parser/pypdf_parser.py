@@ -0,0 +1,49 @@
+"""Fast PDF parser using pypdf for text extraction, falling back to pdfplumber."""
+
+from pathlib import Path
+
+from loguru import logger
+from pypdf import PdfReader
+
+from src.parser.pdfplumber_parser import _TXN_LINE_RE, PdfPlumberParser
+
+# Below this many non-whitespace characters the pypdf extraction is
+# considered to have failed (scanned or oddly encoded document)
+_MIN_DOC_CHARS = 200
+
+
+class FastPypdfParser(PdfPlumberParser):
+    """Statement parser that extracts text with pypdf instead of pdfplumber.
+
+    pypdf is several times faster per page than pdfplumber and produces
+    comparable text for born-digital statements. When its output looks
+    wrong (near-empty pages, no amounts or transaction-shaped lines), the
+    document is re-extracted with pdfplumber, so the fallback costs one
+    extra extraction pass but never loses transactions. Everything after
+    text extraction is shared with PdfPlumberParser.
+    """
+
+    def _extract_pages_text(self, pdf_path: Path) -> dict[int, str]:
+        try:
+            reader = PdfReader(pdf_path)
+            logger.info(f"PDF has {len(reader.pages)} page(s)")
+            pages_text = {
+                i + 1: page.extract_text() or "" for i, page in enumerate(reader.pages)
+            }
+        except Exception as e:
+            logger.warning(f"pypdf extraction failed ({e}), falling back to pdfplumber")
+            return super()._extract_pages_text(pdf_path)
+
+        if self._looks_ok(pages_text):
+            return pages_text
+
+        logger.info("pypdf text looks incomplete, re-extracting with pdfplumber")
+        return super()._extract_pages_text(pdf_path)
+
+    @staticmethod
+    def _looks_ok(pages_text: dict[int, str]) -> bool:
+        """Heuristic check that extraction produced usable statement text."""
+        full_text = "\n".join(pages_text.values())
+        if sum(1 for c in full_text if not c.isspace()) < _MIN_DOC_CHARS:
+            return False
+        return "$" in full_text or _TXN_LINE_RE.search(full_text) is not None
@@ -1,17 +1,21 @@
 """Pipeline orchestrator for parsing and categorizing transactions."""
 
 import csv
+import queue
+import threading
 import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from loguru import logger
 
-from src.categorizer import Categorizer
+from src.categorizer import DEFAULT_CONCURRENCY, Categorizer
 from src.clients.ollama import OllamaClient
 from src.logging_config import DebugArtifacts
 from src.models import CategoriesConfig, CategorizedTransaction, RawTransaction
 from src.parser.base import BaseParser
-from src.parser.pdfplumber_parser import PdfPlumberParser
+from src.parser.pypdf_parser import FastPypdfParser
 
 
 class Pipeline:
@@ -23,8 +27,10 @@ class Pipeline:
         ollama_host: str = "localhost",
         ollama_port: int = 11434,
         ollama_model: str = "mistral",
+        concurrency: int = DEFAULT_CONCURRENCY,
         debug_artifacts: DebugArtifacts | None = None,
         parser: BaseParser | None = None,
+        cache_path: Path | None = None,
     ):
         """Initialize the pipeline.
 
@@ -33,8 +39,12 @@ class Pipeline:
             ollama_host: Ollama server host
             ollama_port: Ollama server port
             ollama_model: Ollama model name
+            concurrency: Max concurrent categorization requests to Ollama
             debug_artifacts: Optional debug artifact manager
-            parser: Optional custom parser (defaults to PdfPlumberParser)
+            parser: Optional custom parser (defaults to FastPypdfParser,
+                which falls back to pdfplumber extraction when needed)
+            cache_path: Optional path for the persistent description ->
+                category cache (None disables it)
         """
         self.categories = categories
         self.debug_artifacts = debug_artifacts or DebugArtifacts()
@@ -45,14 +55,18 @@ class Pipeline:
             port=ollama_port,
             model=ollama_model,
         )
-        self._parser = parser or PdfPlumberParser(
+        # pypdf-first with internal pdfplumber fallback; pass parser= to
+        # force a specific backend
+        self._parser = parser or FastPypdfParser(
             ollama_client=self._ollama,
             debug_artifacts=self.debug_artifacts,
         )
         self._categorizer = Categorizer(
             categories=categories,
             ollama_client=self._ollama,
+            concurrency=concurrency,
             debug_artifacts=self.debug_artifacts,
+            cache_path=cache_path,
         )
 
     def process(
@@ -74,26 +88,78 @@ class Pipeline:
         pipeline_start = time.perf_counter()
         logger.info(f"Processing {len(pdf_paths)} PDF file(s)")
 
-        # Step 1: Parse all PDFs
+        # Parse and categorize overlap as a producer/consumer pipeline: a
+        # background thread feeds per-PDF transaction batches through a
+        # queue while this thread categorizes each batch as it lands, so
+        # wall time approaches max(parse, categorize) instead of the sum.
+        # Independent files additionally overlap in a thread pool — while
+        # one waits on the Ollama server the others run text extraction.
+        # (Threads, not processes — the parser shares one HTTP client,
+        # which does not cross a pickle boundary.)
         parse_start = time.perf_counter()
         all_transactions: list[RawTransaction] = []
-        for i, pdf_path in enumerate(pdf_paths):
-            logger.info(f"[{i + 1}/{len(pdf_paths)}] {pdf_path.name}")
+        categorized: list[CategorizedTransaction] = []
+
+        def _parse_one(pdf_path: Path) -> list[RawTransaction]:
             try:
-                transactions = self._parser.parse(pdf_path, statement_year=statement_year)
-                all_transactions.extend(transactions)
+                return self._parser.parse(pdf_path, statement_year=statement_year)
             except Exception as e:
                 logger.error(f"Failed to parse {pdf_path.name}: {e}")
-                continue
+                return []
+
+        batches: queue.Queue[list[RawTransaction] | None] = queue.Queue(maxsize=8)
 
+        def _produce() -> None:
+            try:
+                if len(pdf_paths) > 1:
+                    with ThreadPoolExecutor(max_workers=min(len(pdf_paths), 4)) as executor:
+                        for transactions in executor.map(_parse_one, pdf_paths):
+                            batches.put(transactions)
+                else:
+                    for pdf_path in pdf_paths:
+                        batches.put(_parse_one(pdf_path))
+            finally:
+                batches.put(None)  # Sentinel: parsing is done
+
+        producer = threading.Thread(target=_produce, daemon=True)
+        producer.start()
+
+        connection_checked = False
+        try:
+            while (batch := batches.get()) is not None:
+                all_transactions.extend(batch)
+                if dry_run or not batch:
+                    continue
+
+                # Check Ollama connection (once, before the first real call)
+                if not connection_checked:
+                    if not self._ollama.check_connection():
+                        logger.error("Cannot connect to Ollama. Is it running?")
+                        raise RuntimeError("Ollama connection failed")
+                    connection_checked = True
+
+                categorized.extend(self._categorizer.categorize(batch))
+        except BaseException:
+            # Unblock the producer before propagating: it may be parked on
+            # batches.put against the bounded queue, and __exit__ would
+            # otherwise close the shared Ollama client mid-parse. Draining
+            # to the sentinel lets it finish and lets us join below.
+            while batches.get() is not None:
+                pass
+            producer.join()
+            raise
+
+        producer.join()
         parse_time = time.perf_counter() - parse_start
         logger.info(f"[TIMING] All PDFs parsed: {parse_time:.2f}s ({len(all_transactions)} transactions)")
 
         if dry_run:
             total_time = time.perf_counter() - pipeline_start
             logger.info(f"[TIMING] Pipeline total (dry-run): {total_time:.2f}s")
+            # model_construct skips re-validating fields that just came
+            # out of validated RawTransactions
             return [
-                CategorizedTransaction(
+                CategorizedTransaction.model_construct(
                     date=tx.date,
                     description=tx.description,
                     amount=tx.amount,
@@ -102,17 +168,6 @@ class Pipeline:
                 for tx in all_transactions
             ]
 
-        # Step 2: Categorize transactions
-        if not all_transactions:
-            return []
-
-        # Check Ollama connection
-        if not self._ollama.check_connection():
-            logger.error("Cannot connect to Ollama. Is it running?")
-            raise RuntimeError("Ollama connection failed")
-
-        categorized = self._categorizer.categorize(all_transactions)
-
         total_time = time.perf_counter() - pipeline_start
         logger.info(f"[TIMING] Pipeline total: {total_time:.2f}s")
 
@@ -135,14 +190,15 @@ class Pipeline:
 
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, "w", newline="") as f:
-            writer = csv.DictWriter(
-                f,
-                fieldnames=["date", "description", "amount", "category"],
+        # Plain csv.writer over tuples: no per-row dict building, and
+        # writerows keeps the loop in C
+        with open(output_path, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+            writer = csv.writer(f)
+            writer.writerow(("date", "description", "amount", "category"))
+            writer.writerows(
+                (tx.date.isoformat(), tx.description, str(tx.amount), tx.category)
+                for tx in transactions
             )
-            writer.writeheader()
-            for tx in transactions:
-                writer.writerow(tx.to_csv_row())
 
         logger.info(f"Wrote {len(transactions)} transactions to {output_path}")
 
@@ -157,22 +213,20 @@ class Pipeline:
             transactions: List of categorized transactions
             output_path: Path for output CSV file
         """
-        category_totals: dict[str, float] = {}
+        # Accumulate in integer cents: exact and cheaper per row than float
+        category_totals: defaultdict[str, int] = defaultdict(int)
         for tx in transactions:
-            category_totals[tx.category] = (
-                category_totals.get(tx.category, 0) + float(tx.amount)
-            )
+            category_totals[tx.category] += tx.amount_cents
 
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, "w", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=["category", "total"])
-            writer.writeheader()
-            for category_name in self.categories.get_category_names():
-                writer.writerow({
-                    "category": category_name,
-                    "total": f"{category_totals.get(category_name, 0):.2f}",
-                })
+        with open(output_path, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+            writer = csv.writer(f)
+            writer.writerow(("category", "total"))
+            writer.writerows(
+                (name, f"{category_totals.get(name, 0) / 100:.2f}")
+                for name in self.categories.get_category_names()
+            )
 
         logger.info(f"Wrote summary to {output_path}")
 
@@ -182,22 +236,14 @@ class Pipeline:
             print("No transactions processed.")
             return
 
-        # Count by category
-        category_counts: dict[str, int] = {}
-        category_totals: dict[str, float] = {}
-
+        # Counter consumes the generator at C speed; totals stay in
+        # integer cents (exact, and cheaper than float per row)
+        category_counts = Counter(tx.category for tx in transactions)
+        category_totals: defaultdict[str, int] = defaultdict(int)
         for tx in transactions:
-            category_counts[tx.category] = category_counts.get(tx.category, 0) + 1
-            category_totals[tx.category] = (
-                category_totals.get(tx.category, 0) + float(tx.amount)
-            )
+            category_totals[tx.category] += tx.amount_cents
 
-        # Sort by count descending
-        sorted_categories = sorted(
-            category_counts.items(),
-            key=lambda x: x[1],
-            reverse=True,
-        )
+        sorted_categories = category_counts.most_common()
 
         print("\n" + "=" * 50)
         print("SUMMARY")
@@ -207,7 +253,7 @@ class Pipeline:
 
         for category, count in sorted_categories:
             pct = count / len(transactions) * 100
-            total = category_totals[category]
+            total = category_totals[category] / 100
             print(f"  {category:20s} {count:4d} ({pct:5.1f}%)  ${total:>10,.2f}")
 
         print("=" * 50)
@@ -1,11 +1,11 @@
 """Budget sheet uploader for Google Sheets."""
 
 import csv
-import json
 import re
 from dataclasses import dataclass
 from pathlib import Path
 
+import orjson
 from loguru import logger
 
 from src.clients.gsheets import GSheetsClient, GSheetsError
@@ -13,8 +13,12 @@ from src.clients.gsheets import GSheetsClient, GSheetsError
 # Default config file path
 DEFAULT_CONFIG_PATH = Path(__file__).parent.parent.parent / "config" / "google_sheet_config.json"
 
+# Currency symbols, commas, and whitespace — compiled once, hit only by
+# values that don't parse as plain floats
+_CURRENCY_RE = re.compile(r"[$,\s]")
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class CellUpdate:
     """Represents an update to a cell."""
 
@@ -25,7 +29,7 @@ class CellUpdate:
     amount_added: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UploadResult:
     """Result of a budget upload operation."""
 
@@ -48,8 +52,13 @@ def parse_currency(value: str | None) -> float:
     if not value:
         return 0.0
 
-    # Remove currency symbols, commas, and whitespace
-    cleaned = re.sub(r"[$,\s]", "", value.strip())
+    # Fast path: values we wrote ourselves are plain numerics
+    try:
+        return float(value)
+    except ValueError:
+        pass
+
+    cleaned = _CURRENCY_RE.sub("", value)
 
     if not cleaned:
         return 0.0
@@ -79,8 +88,7 @@ class SheetConfig:
         if not self.config_path.exists():
             raise FileNotFoundError(f"Config file not found: {self.config_path}")
 
-        with open(self.config_path) as f:
-            self._data = json.load(f)
+        self._data = orjson.loads(self.config_path.read_bytes())
 
         logger.debug(f"Loaded {len(self.mappings)} category mappings from {self.config_path}")
 
@@ -173,35 +181,43 @@ class BudgetUploader:
 
         totals: dict[str, float] = {}
 
-        with open(summary_path, newline="") as f:
-            reader = csv.DictReader(f)
-            fieldnames = reader.fieldnames or []
+        with open(summary_path, newline="", encoding="utf-8", buffering=1 << 20) as f:
+            # Positional csv.reader with cached column indices avoids the
+            # per-row dict that DictReader allocates
+            reader = csv.reader(f)
+            header = next(reader, None) or []
 
-            if "category" not in fieldnames:
+            if "category" not in header:
                 raise ValueError("Summary CSV must have a 'category' column")
-            if "total" not in fieldnames:
+            if "total" not in header:
                 raise ValueError("Summary CSV must have a 'total' column")
 
-            has_year_month = "year" in fieldnames and "month" in fieldnames
+            i_category = header.index("category")
+            i_total = header.index("total")
+
+            has_year_month = "year" in header and "month" in header
+
+            # Filter comparisons happen on strings so unfiltered loads
+            # never pay the per-row int() conversions
+            year_str = str(year) if has_year_month and year is not None else None
+            month_str = str(month) if has_year_month and month is not None else None
+            i_year = header.index("year") if has_year_month else 0
+            i_month = header.index("month") if has_year_month else 0
 
             for row in reader:
-                # Filter by year/month if specified and columns exist
-                if has_year_month and year is not None:
-                    row_year = int(row["year"])
-                    if row_year != year:
-                        continue
-                if has_year_month and month is not None:
-                    row_month = int(row["month"])
-                    if row_month != month:
-                        continue
-
-                category = row["category"]
-                try:
-                    total = float(row["total"].replace("$", "").replace(",", ""))
-                    # Aggregate if same category appears multiple times
-                    totals[category] = totals.get(category, 0) + total
-                except ValueError:
-                    logger.warning(f"Skipping invalid total for {category}: {row['total']}")
+                # DictReader skipped blank lines (a common Excel
+                # artifact); the positional reader has to do it explicitly
+                if not row:
+                    continue
+
+                if year_str is not None and row[i_year].lstrip("0") != year_str.lstrip("0"):
+                    continue
+                if month_str is not None and row[i_month].lstrip("0") != month_str.lstrip("0"):
+                    continue
+
+                category = row[i_category]
+                # Aggregate if same category appears multiple times
+                totals[category] = totals.get(category, 0) + parse_currency(row[i_total])
 
         filter_desc = ""
         if year is not None or month is not None:
@@ -245,20 +261,10 @@ class BudgetUploader:
             logger.info(f"[DRY RUN] Would create sheet '{target_sheet}' from template '{template}'")
             # For dry run, just get the template to read current values
             worksheet = self.client.get_worksheet(spreadsheet_id, template)
+            shallow_cells = []
         else:
             worksheet = self.client.duplicate_sheet(spreadsheet_id, template, target_sheet)
-
-            # Convert formula cells to values if specified
             shallow_cells = self.mapping.shallow_copy_cells
-            if shallow_cells:
-                logger.info(f"Converting {len(shallow_cells)} cells from formulas to values...")
-                current_values = self.client.read_cells(worksheet, shallow_cells)
-                # Write back as values (this replaces any formulas)
-                values_to_write = {
-                    cell: parse_currency(value) for cell, value in current_values.items()
-                }
-                self.client.write_cells(worksheet, values_to_write)
-                logger.debug(f"Shallow copied cells: {shallow_cells}")
 
         # Determine which cells we need to update (include zeros to overwrite formulas)
         cells_to_update: dict[str, tuple[str, float]] = {}  # cell -> (category, amount)
@@ -276,18 +282,26 @@ class BudgetUploader:
 
             cells_to_update[cell] = (category, amount)
 
-        if not cells_to_update:
+        if not cells_to_update and not shallow_cells:
             logger.info("No cells to update")
             return UploadResult(updates=[], skipped_categories=[], unmapped_categories=unmapped)
 
-        # Read current values
-        logger.info(f"Reading {len(cells_to_update)} cells from sheet...")
-        current_values = self.client.read_cells(worksheet, list(cells_to_update.keys()))
+        # One batched read covering both the shallow-copy cells and the
+        # update targets, and one batched write for all new values —
+        # instead of a read+write round trip per group
+        all_cells = sorted(set(shallow_cells) | set(cells_to_update))
+        logger.info(f"Reading {len(all_cells)} cells from sheet...")
+        current_values = self.client.read_cells(worksheet, all_cells)
 
-        # Calculate updates
         updates: list[CellUpdate] = []
         new_values: dict[str, float] = {}
 
+        # Formula cells become their current values (an updated cell gets
+        # its new value written anyway, which converts it just the same)
+        for cell in shallow_cells:
+            if cell not in cells_to_update:
+                new_values[cell] = parse_currency(current_values.get(cell))
+
         for cell, (category, amount) in cells_to_update.items():
             old_value = parse_currency(current_values.get(cell))
             new_value = old_value + amount
@@ -305,7 +319,9 @@ class BudgetUploader:
         if dry_run:
             logger.info(f"[DRY RUN] Would update {len(updates)} cells")
         else:
-            logger.info(f"Updating {len(updates)} cells...")
+            if shallow_cells:
+                logger.debug(f"Shallow copied cells: {shallow_cells}")
+            logger.info(f"Updating {len(new_values)} cells...")
             self.client.write_cells(worksheet, new_values)
             logger.info(f"Successfully updated {len(updates)} cells")
 